@@ -1,117 +1,283 @@
+import argparse
+import functools
 import os
-import subprocess
+import re
 import shutil
-from pathlib import Path
-import site
-import PyQt6
+import subprocess
+import sys
+
+SCRIPT_PATH = "vce_viewer.py"  # Main script name
+OUTPUT_DIR = "dist"  # PyInstaller output directory
+BUILD_DIR = "build"  # PyInstaller build directory
+SPEC_DIR = "spec"  # Directory for .spec file
+SPEC_PATH = os.path.join(SPEC_DIR, "VCEViewer.spec")  # Spec generated by previous builds
+LIBREOFFICE_HINT_FILE = "libreoffice_path.txt"  # Read by the app at conversion time
+
+# Qt plugin subdirectories the viewer actually loads
+QT_PLUGIN_DIRS = {"platforms", "platformthemes", "styles", "imageformats", "iconengines", "tls"}
+# PyQt6 modules always bundled on top of those the script imports
+# (QtPdf pulls in QtNetwork)
+PYQT6_BASE_MODULES = {"sip", "QtCore", "QtGui", "QtNetwork"}
+# Locales whose Qt translation catalogues are bundled
+QT_TRANSLATION_LOCALES = {"en"}
+
+# Shipped next to the app to explain the LibreOffice dependency
+README_CONTENT = """VCE Exam Report Viewer
+=====================
+This application requires LibreOffice to convert .doc/.docx files to PDF.
+Please install LibreOffice from https://www.libreoffice.org/download/download/
+and ensure it is available in your PATH as 'soffice.exe'.
+
+To run the application:
+1. Double-click VCEViewer.exe to launch.
+2. If Windows Defender shows a warning, click 'More info' and 'Run anyway'.
+3. Ensure LibreOffice is installed for .doc/.docx conversion functionality.
+""".encode("ascii")
+
+
+@functools.lru_cache(maxsize=None)
+def _pyqt6_roots():
+    """Return the candidate PyQt6 resource roots, computed once per process."""
+    import site
+    import PyQt6
+
+    pyqt6_path = os.path.dirname(PyQt6.__file__)
+    site_pyqt6_path = os.path.join(site.getsitepackages()[0], "PyQt6")
+    return (
+        os.path.join(pyqt6_path, "Qt6"),  # Standard PyQt6 structure
+        pyqt6_path,  # Alternative structure
+        os.path.join(site_pyqt6_path, "Qt6"),
+        site_pyqt6_path,
+    )
 
 
 def find_pyqt6_resource_path(resource):
     """Find the path to a PyQt6 resource (e.g., plugins, translations)."""
-    pyqt6_path = os.path.dirname(PyQt6.__file__)
-    possible_paths = [
-        os.path.join(pyqt6_path, "Qt6", resource),  # Standard PyQt6 structure
-        os.path.join(pyqt6_path, resource),  # Alternative structure
-        os.path.join(site.getsitepackages()[0], "PyQt6", "Qt6", resource),
-        os.path.join(site.getsitepackages()[0], "PyQt6", resource)
-    ]
-    for path in possible_paths:
-        if os.path.exists(path):
+    for root in _pyqt6_roots():
+        path = os.path.join(root, resource)
+        if os.path.isdir(path):
             return path
     raise FileNotFoundError(f"Could not find PyQt6 {resource} directory")
 
 
-def package_program():
-    # Define paths
-    script_path = "vce_viewer.py"  # Main script name
-    output_dir = Path("dist")  # PyInstaller output directory
-    build_dir = Path("build")  # PyInstaller build directory
-    spec_dir = Path("spec")  # Directory for .spec file
-    icon_path = Path.cwd() / "app_icon.ico"  # Path to .ico file in project root
-    uploads_dir = Path.cwd() / "uploaded_reports"  # Absolute path for uploaded_reports
+def _fast_rmtree(path):
+    """Delete a directory tree, relying on os.scandir's cached entry types."""
+    pending = [path]
+    found_dirs = []
+    while pending:
+        current = pending.pop()
+        found_dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    os.unlink(entry.path)
+    # Parents were found before their children, so remove in reverse order
+    for dir_path in reversed(found_dirs):
+        os.rmdir(dir_path)
 
-    # Ensure the main script exists
-    if not Path(script_path).exists():
-        print(f"Error: {script_path} not found.")
-        return
 
-    # Create uploaded_reports directory if it doesn't exist
-    uploads_dir.mkdir(exist_ok=True)
-    # Create a placeholder file to ensure the directory is included
-    placeholder_path = uploads_dir / ".placeholder"
-    placeholder_path.touch(exist_ok=True)
+def qt_data_args(plugins_path, translations_path):
+    """Return --add-data arguments for only the Qt plugins and translations we use."""
+    args = []
+    with os.scandir(plugins_path) as entries:
+        for entry in entries:
+            if entry.name in QT_PLUGIN_DIRS and entry.is_dir():
+                args.append(f"--add-data={entry.path};PyQt6/Qt6/plugins/{entry.name}")
+    with os.scandir(translations_path) as entries:
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext == ".qm" and stem.rsplit("_", 1)[-1] in QT_TRANSLATION_LOCALES:
+                args.append(f"--add-data={entry.path};PyQt6/Qt6/translations")
+    return sorted(args)
 
-    # Clean previous builds
-    for dir_path in [output_dir, build_dir, spec_dir]:
-        if dir_path.exists():
-            shutil.rmtree(dir_path)
 
-    # Create spec directory
-    spec_dir.mkdir(exist_ok=True)
+def pyqt6_exclude_args(script_path):
+    """Return --exclude-module arguments for PyQt6 modules the script never imports."""
+    import PyQt6
 
-    # Find PyQt6 plugins and translations paths
+    with open(script_path, encoding="utf-8") as f:
+        used = PYQT6_BASE_MODULES | set(re.findall(r"\bPyQt6\.(\w+)", f.read()))
+    available = set()
+    with os.scandir(os.path.dirname(PyQt6.__file__)) as entries:
+        for entry in entries:
+            name, _, ext = entry.name.partition(".")
+            if name.startswith("Qt") and ext.endswith(("so", "pyd")):
+                available.add(name)
+    return [f"--exclude-module=PyQt6.{name}" for name in sorted(available - used)]
+
+
+def _spec_is_fresh(spec_path, *sources):
+    """Return True if spec_path exists and is newer than every source file."""
     try:
-        plugins_path = find_pyqt6_resource_path("plugins")
-        translations_path = find_pyqt6_resource_path("translations")
-    except FileNotFoundError as e:
-        print(f"Error: {e}")
-        return
+        spec_mtime = os.stat(spec_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(os.stat(source).st_mtime_ns < spec_mtime for source in sources)
+
 
-    # PyInstaller command for Windows
-    pyinstaller_cmd = [
-        "pyinstaller",
+def build_pyinstaller_cmd(script_path, output_dir, build_dir, spec_dir, icon_path,
+                          uploads_dir, plugins_path, translations_path):
+    """Return the PyInstaller arguments (without the program name) for the Windows build."""
+    return [
         "--noconfirm",  # Overwrite without confirmation
         "--onefile",  # Create a single executable
         "--noconsole",  # Run without a console window (headless)
+        "--optimize=2",  # Strip asserts and docstrings from bundled bytecode
         f"--distpath={output_dir}",
         f"--workpath={build_dir}",
         f"--specpath={spec_dir}",
-        # Add PyQt6 plugins and translations (Windows uses ; separator)
-        f"--add-data={plugins_path};PyQt6/Qt6/plugins",
-        f"--add-data={translations_path};PyQt6/Qt6/translations",
+        # Add only the PyQt6 plugins and translations the app uses (Windows uses ; separator)
+        *qt_data_args(plugins_path, translations_path),
         # Add uploaded_reports directory structure
         f"--add-data={uploads_dir};uploaded_reports",
         # Optional: Icon for the .exe
-        *(["--icon", str(icon_path)] if icon_path.exists() else []),
+        *(["--icon", icon_path] if os.path.isfile(icon_path) else []),
         # Hidden imports to ensure all dependencies are included
         "--hidden-import=PyQt6.QtPdf",
         "--hidden-import=PyQt6.QtPdfWidgets",
-        "--hidden-import=bs4",
+        "--hidden-import=lxml.html",
         "--hidden-import=requests",
+        # Leave out the PyQt6 modules the viewer never loads
+        *pyqt6_exclude_args(script_path),
         # Set the name of the executable
         "--name=VCEViewer",
         # Main script
         script_path
     ]
 
-    # Run PyInstaller
-    print("Running PyInstaller...")
+
+def prepare_package(force_rebuild=False):
+    """Prepare the build directories and return the PyInstaller arguments, or None on error."""
+    # Define paths
+    cwd = os.getcwd()  # Project root
+    icon_path = os.path.join(cwd, "app_icon.ico")  # Path to .ico file in project root
+    uploads_dir = os.path.join(cwd, "uploaded_reports")  # Absolute path for uploaded_reports
+
+    # Ensure the main script exists
+    if not os.path.isfile(SCRIPT_PATH):
+        print(f"Error: {SCRIPT_PATH} not found.")
+        return None
+
+    # Create uploaded_reports with a placeholder file so the directory is
+    # included; skip both steps when the placeholder is already there
+    placeholder_path = os.path.join(uploads_dir, ".placeholder")
+    if not os.path.lexists(placeholder_path):
+        os.makedirs(uploads_dir, exist_ok=True)
+        open(placeholder_path, "a").close()
+
+    # Keep PyInstaller's binary cache in a stable per-project location so it
+    # survives across checkouts (CI should cache this directory)
+    os.environ.setdefault("PYINSTALLER_CONFIG_DIR", os.path.join(cwd, ".pyinstaller-cache"))
+
+    # Clean previous output; BUILD_DIR and SPEC_DIR are kept so PyInstaller can
+    # reuse its analysis, stripped/compressed libraries and spec between runs
     try:
-        subprocess.run(pyinstaller_cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"PyInstaller failed: {e}")
+        _fast_rmtree(OUTPUT_DIR)
+    except FileNotFoundError:
+        pass  # Nothing to clean on a fresh checkout
+
+    # Create spec directory
+    os.makedirs(SPEC_DIR, exist_ok=True)
+
+    # Reuse the spec from the last build unless the sources changed since
+    if not force_rebuild and _spec_is_fresh(SPEC_PATH, SCRIPT_PATH, __file__):
+        pyinstaller_cmd = [
+            "--noconfirm",
+            f"--distpath={OUTPUT_DIR}",
+            f"--workpath={BUILD_DIR}",
+            SPEC_PATH,
+        ]
+    else:
+        # Find PyQt6 plugins and translations paths
+        try:
+            plugins_path = find_pyqt6_resource_path("plugins")
+            translations_path = find_pyqt6_resource_path("translations")
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            return None
+
+        pyinstaller_cmd = build_pyinstaller_cmd(
+            SCRIPT_PATH,
+            OUTPUT_DIR,
+            BUILD_DIR,
+            SPEC_DIR,
+            icon_path,
+            uploads_dir,
+            plugins_path,
+            translations_path,
+        )
+
+    return pyinstaller_cmd
+
+
+def finalize_package(handle=None):
+    """Write the post-build files, first waiting on a background build handle if given."""
+    if handle is not None and handle.wait():
+        print(f"PyInstaller failed: exit code {handle.returncode}")
         return
 
     # Post-processing: Create a README for LibreOffice dependency
-    readme_content = """VCE Exam Report Viewer
-=====================
-This application requires LibreOffice to convert .doc/.docx files to PDF.
-Please install LibreOffice from https://www.libreoffice.org/download/download/
-and ensure it is available in your PATH as 'soffice.exe'.
+    readme_path = os.path.join(OUTPUT_DIR, "README.txt")
+    fd = os.open(readme_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, README_CONTENT)
+    finally:
+        os.close(fd)
 
-To run the application:
-1. Double-click VCEViewer.exe to launch.
-2. If Windows Defender shows a warning, click 'More info' and 'Run anyway'.
-3. Ensure LibreOffice is installed for .doc/.docx conversion functionality.
-"""
-    readme_path = output_dir / "README.txt"
-    with open(readme_path, "w") as f:
-        f.write(readme_content)
+    # Record the LibreOffice found on this machine; the app tries it before
+    # probing its own list of install locations (empty when none was found)
+    soffice = shutil.which("soffice") or shutil.which("libreoffice") or ""
+    with open(os.path.join(OUTPUT_DIR, LIBREOFFICE_HINT_FILE), "w", encoding="utf-8") as f:
+        f.write(soffice)
+
+    sys.stdout.write("\n".join([
+        "Packaging complete! The executable is located at:",
+        os.path.join(OUTPUT_DIR, "VCEViewer.exe"),
+        "Note: Users must install LibreOffice separately for .doc/.docx conversion.",
+    ]) + "\n")
+    sys.stdout.flush()
+
+
+def package_program(force_rebuild=False, background=False):
+    """Build the app with PyInstaller.
+
+    Blocks until the build is finished by default. With background=True,
+    PyInstaller runs in a child process and its Popen handle is returned;
+    pass it to finalize_package() once the caller is ready to wait on it.
+    """
+    pyinstaller_cmd = prepare_package(force_rebuild)
+    if pyinstaller_cmd is None:
+        return None
+
+    print("Running PyInstaller...")
+    if background:
+        return subprocess.Popen([sys.executable, "-m", "PyInstaller", *pyinstaller_cmd])
+
+    # Run in-process to avoid a second interpreter start-up and PyInstaller import
+    import PyInstaller.__main__
+
+    try:
+        PyInstaller.__main__.run(pyinstaller_cmd)
+    except SystemExit as e:
+        if e.code:
+            print(f"PyInstaller failed: exit code {e.code}")
+            return None
+    except Exception as e:
+        print(f"PyInstaller failed: {e}")
+        return None
 
-    print("Packaging complete! The executable is located at:")
-    print(f"{output_dir / 'VCEViewer.exe'}")
-    print("Note: Users must install LibreOffice separately for .doc/.docx conversion.")
+    finalize_package()
+    return None
 
 
 if __name__ == "__main__":
-    package_program()
+    parser = argparse.ArgumentParser(description="Package VCE Viewer with PyInstaller.")
+    parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="regenerate the .spec file even if it looks up to date",
+    )
+    args = parser.parse_args()
+    package_program(force_rebuild=args.force_rebuild)
@@ -3,6 +3,11 @@ import os
 import shutil
 import subprocess
 import re
+import errno
+import html
+import functools
+from collections import deque
+import tempfile
 from pathlib import Path
 from urllib.parse import urljoin
 import concurrent.futures
@@ -10,9 +15,19 @@ import threading
 
 import shutil as _shutil
 import requests
-from bs4 import BeautifulSoup
-
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPoint
+import requests_cache
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import InsecureRequestWarning
+from lxml import html as lxml_html
+
+try:
+    import ahocorasick  # optional, speeds up subject alias lookup
+except ImportError:
+    ahocorasick = None
+
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPoint, QTimer, QFileSystemWatcher
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -38,7 +53,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtPdfWidgets import QPdfView
 from PyQt6.QtPdf import QPdfDocument
-from PyQt6.QtGui import QWheelEvent
+from PyQt6.QtGui import QWheelEvent, QFont, QStandardItemModel, QStandardItem
 
 
 # ------------------ SETTINGS ------------------
@@ -58,8 +73,14 @@ UPLOAD_DIR = get_upload_dir()
 CONVERTED_DIR = UPLOAD_DIR / "converted"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 CONVERTED_DIR.mkdir(exist_ok=True)
-SUPPORTED_EXTENSIONS = {".pdf", ".doc", ".docx"}  # include .doc too for older reports
-WORD_EXTENSIONS = {".doc", ".docx"}
+SUPPORTED_EXTENSIONS = frozenset({".pdf", ".doc", ".docx"})  # include .doc too for older reports
+WORD_EXTENSIONS = frozenset({".doc", ".docx"})
+# Concurrent LibreOffice instances, each with its own user profile
+MAX_CONVERSION_WORKERS = max(1, min(4, os.cpu_count() or 1))
+# Most documents handed to a single soffice process
+CONVERSION_BATCH_SIZE = 10
+# Uploaded files copied at the same time
+UPLOAD_COPY_WORKERS = 4
 
 VCAA_BASE = "https://www.vcaa.vic.edu.au"
 VCAA_SUBJECTS_PAGE = (
@@ -68,6 +89,42 @@ VCAA_SUBJECTS_PAGE = (
         + "examination-specifications-past-examinations-and-external-assessment-reports"
 )
 
+# VCAA requests run with verify=False; don't raise a warning for every one of them
+urllib3.disable_warnings(InsecureRequestWarning)
+
+# Concurrent report downloads; the session pool holds one connection per worker
+DOWNLOAD_WORKERS = 16
+
+
+def _configure_session(session):
+    """Apply the shared VCAA headers and connection pool to a requests session."""
+    session.headers.update({"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"})
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=DOWNLOAD_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        ),
+    )
+    return session
+
+
+# Shared session so every VCAA request reuses pooled keep-alive connections
+SESSION = _configure_session(requests.Session())
+# Index and subject pages rarely change, so keep them for a day on disk;
+# report files go through SESSION so they never bloat the cache. The DB lives in
+# the user cache dir, away from the watched reports folder
+PAGE_SESSION = _configure_session(
+    requests_cache.CachedSession(
+        "vce_viewer_http",
+        use_cache_dir=True,
+        expire_after=86400,
+        allowable_methods=("GET",),
+        cache_control=True,
+    )
+)
+
 # Always skip these (case-insensitive)
 EXCLUDE_HINTS = [
     "sample",  # sample exams
@@ -82,6 +139,12 @@ EXCLUDE_HINTS = [
 # We accept links whose VISIBLE TEXT contains "report"
 REPORT_TOKEN = "report"
 
+# Report downloads we know how to open
+DOC_LINK_EXTS = (".pdf", ".docx", ".doc")
+
+# Written next to the bundled executable by the packaging script
+LIBREOFFICE_HINT_FILE = "libreoffice_path.txt"
+
 # ------------------ SUBJECT NORMALISATION (for filename parsing only) ------------------
 SUBJECT_ALIASES = {
     "mathmethodscas": "MathMethodsCAS",
@@ -99,11 +162,70 @@ SUBJECT_ALIASES = {
 
 
 # ------------------ UTILS ------------------
+def _bundled_soffice_hint():
+    """Return the LibreOffice path recorded at packaging time, if it exists here."""
+    if not getattr(sys, "frozen", False):
+        return None
+    hint_path = Path(sys.executable).parent / LIBREOFFICE_HINT_FILE
+    try:
+        path = hint_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return path if path and os.path.isfile(path) else None
+
+
+def _move_file(src, dst):
+    """
+    Move src to dst without replacing a different file already at dst.
+    Raises FileExistsError in that case, and leaves src untouched on any
+    failure. A hard link plus unlink is used, with os.replace only as the
+    fallback across volumes or on filesystems without hard links, and for
+    case-only renames of the same file.
+    """
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        if not os.path.samefile(src, dst):
+            raise
+        os.replace(src, dst)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+        os.replace(src, dst)
+    else:
+        try:
+            os.unlink(src)
+        except OSError:
+            # e.g. src is held open on Windows; drop the new name so the move
+            # either happens completely or not at all
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+            raise
+
+
+def _is_other_file(path, own):
+    """True if path exists and is not the same file as own."""
+    try:
+        return not os.path.samefile(path, own)
+    except FileNotFoundError:
+        return os.path.exists(path)
+
+
+@functools.lru_cache(maxsize=1)
 def soffice_cmd():
     """
     Return the path to the LibreOffice CLI binary for headless mode, or None if not found.
     Checks Windows, macOS, and Linux paths, as well as system PATH.
+    The result is cached; call soffice_cmd.cache_clear() to search again.
     """
+    hint = _bundled_soffice_hint()
+    if hint:
+        return hint
+
     possible_paths = []
     if os.name == "nt":  # Windows
         possible_paths.extend([
@@ -124,12 +246,53 @@ def soffice_cmd():
         ])
 
     for path in possible_paths:
-        if _shutil.which(path) or os.path.exists(path):
-            return path
+        # Known install locations only need a stat; PATH is searched for bare names
+        if os.path.isabs(path):
+            if os.path.isfile(path):
+                return path
+        else:
+            found = _shutil.which(path)
+            if found:
+                return found
     return None  # Indicate LibreOffice is not available
 
 
 # ------------------ PARSING ------------------
+_RE_TOKENS = re.compile(r"[-_\s]?(assessrep|examreport|examrep|externalassessmentreport|report|exam)")
+_RE_PAREN = re.compile(r"\s*\(\d+\)")
+_RE_YEAR = re.compile(r"(20\d{2})")
+_RE_TRAIL2 = re.compile(r"(\d{2})$")
+_RE_EXAM = re.compile(r"(?:ex|exam)?[-_]?([12])\b")
+_RE_TRAIL1 = re.compile(r"(\d)$")
+# One alternative per alias, tried in dict order, so the first alias found
+# anywhere in the name wins (same priority as a loop over SUBJECT_ALIASES)
+_RE_SUBJECT = re.compile(
+    "|".join(f".*?({re.escape(key)})" for key in SUBJECT_ALIASES), re.DOTALL
+)
+_SUBJECT_VALUES = tuple(SUBJECT_ALIASES.values())
+
+if ahocorasick is not None:
+    # Single pass over the name finds every alias; each carries its dict
+    # position so the earliest alias still wins, as with _RE_SUBJECT
+    _SUBJECT_AC = ahocorasick.Automaton()
+    for _rank, _key in enumerate(SUBJECT_ALIASES):
+        _SUBJECT_AC.add_word(_key, _rank)
+    _SUBJECT_AC.make_automaton()
+else:
+    _SUBJECT_AC = None
+
+
+def _match_subject(name: str):
+    """Return the subject for the highest-priority alias found in name, or None."""
+    if _SUBJECT_AC is not None:
+        rank = min((r for _, r in _SUBJECT_AC.iter(name)), default=None)
+        return None if rank is None else _SUBJECT_VALUES[rank]
+    subject_match = _RE_SUBJECT.match(name)
+    if subject_match:
+        return _SUBJECT_VALUES[subject_match.lastindex - 1]
+    return None
+
+
 def parse_filename(file_path: Path):
     """
     Parse (best-effort) subject, year and exam number from a file path's name.
@@ -138,87 +301,96 @@ def parse_filename(file_path: Path):
     year = '20xx' or 'Unknown'. exam_number = 'exam1'/'exam2' or 'Unknown'.
     """
     name = file_path.stem.lower()
-    name = re.sub(
-        r"[-_\s]?(assessrep|examreport|examrep|externalassessmentreport|report|exam)",
-        "",
-        name,
-    )
-    name = re.sub(r"\s*\(\d+\)", "", name)
+    name = _RE_TOKENS.sub("", name)
+    name = _RE_PAREN.sub("", name)
     name = name.strip()
 
     # Year
     year = "Unknown"
-    year_match = re.search(r"(20\d{2})", name)
+    year_match = _RE_YEAR.search(name)
     if year_match:
         year = year_match.group(1)
         name = name.replace(year, "").strip("-_ ")
     else:
-        trailing_digit = re.search(r"(\d{2})$", name)
+        trailing_digit = _RE_TRAIL2.search(name)
         if trailing_digit:
             y = int(trailing_digit.group(1))
             if y <= 30:
                 year = f"20{y:02d}"
-                name = re.sub(r"\d{2}$", "", name).strip("-_ ")
+                name = _RE_TRAIL2.sub("", name).strip("-_ ")
 
     # Exam number
     exam_number = "Unknown"
-    ex_match = re.search(r"(?:ex|exam)?[-_]?([12])\b", name)
+    ex_match = _RE_EXAM.search(name)
     if ex_match:
         exam_number = f"exam{ex_match.group(1)}"
-        name = re.sub(r"(?:ex|exam)?[-_]?[12]\b", "", name).strip("-_ ")
+        name = _RE_EXAM.sub("", name).strip("-_ ")
     else:
-        trailing_digit = re.search(r"(\d)$", name)
+        trailing_digit = _RE_TRAIL1.search(name)
         if trailing_digit:
             exam_number = f"exam{trailing_digit.group(1)}"
-            name = re.sub(r"\d$", "", name).strip("-_ ")
+            name = _RE_TRAIL1.sub("", name).strip("-_ ")
 
     # Subject (very rough heuristic — we override this with the user-selected subject on VCAA downloads)
-    subject = "Unknown"
-    for key in SUBJECT_ALIASES:
-        if key in name:
-            subject = SUBJECT_ALIASES[key]
-            break
+    subject = _match_subject(name) or "Unknown"
     if subject == "Unknown" and name:
         subject = name.title()
 
     return subject, year, exam_number
 
 
-# ------------------ DOCX CONVERTER (sequential) ------------------
+# ------------------ DOCX CONVERTER (parallel workers) ------------------
 class DocxConverterThread(QThread):
     progress = pyqtSignal(str, int)  # doc_path, percent
     finished = pyqtSignal(str, str)  # doc_path, pdf_path
     error = pyqtSignal(str, str)  # doc_path, error_message
+    batch_done = pyqtSignal(int)  # worker_id, once every file has been reported
 
-    def __init__(self, docx_path: str, output_dir: str):
+    def __init__(self, docx_paths: list, output_dir: str, worker_id: int = 0):
         super().__init__()
-        self.docx_path = docx_path
+        self.docx_paths = list(docx_paths)
         self.output_dir = output_dir
+        self.worker_id = worker_id
 
     def run(self):
+        try:
+            self._convert_batch()
+        finally:
+            self.batch_done.emit(self.worker_id)
+
+    def _convert_batch(self):
         soffice = soffice_cmd()
         if not soffice:
+            # Don't remember a miss, so installing LibreOffice mid-session works
+            soffice_cmd.cache_clear()
             error_msg = (
                 "LibreOffice is not installed or not found in PATH. "
                 "Please install LibreOffice from https://www.libreoffice.org/download/download/ "
                 "to enable .doc/.docx conversion."
             )
-            self.error.emit(self.docx_path, error_msg)
+            for docx_path in self.docx_paths:
+                self.error.emit(docx_path, error_msg)
             return
 
+        # Signal "started conversion"
+        for docx_path in self.docx_paths:
+            self.progress.emit(docx_path, 60)
         try:
-            # Signal "started conversion"
-            self.progress.emit(self.docx_path, 60)
+            # A separate profile per worker stops parallel instances
+            # contending on LibreOffice's profile lock
+            profile_dir = Path(tempfile.gettempdir()) / f"lo_prof_{self.worker_id}"
+            # One soffice process converts the whole batch, paying start-up once
             cmd = [
                 soffice,
+                f"-env:UserInstallation={profile_dir.as_uri()}",
                 "--headless",
                 "--nologo",
                 "--norestore",
                 "--convert-to",
                 "pdf",
                 "--outdir",
-                str(self.output_dir),  # Ensure string path
-                str(self.docx_path),  # Ensure string path
+                str(self.output_dir),
+                *map(str, self.docx_paths),
             ]
             subprocess.run(
                 cmd,
@@ -226,39 +398,84 @@ class DocxConverterThread(QThread):
                 stderr=subprocess.PIPE,
                 text=True,
                 check=True,
-                shell=(os.name == "nt")  # Use shell on Windows to handle paths with spaces
+                # argv list is passed straight to soffice, so no cmd.exe in
+                # between; keep its console window hidden on Windows
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
             )
+            missing_msg = "Conversion failed: PDF not created."
+        except subprocess.CalledProcessError as e:
+            missing_msg = f"LibreOffice conversion failed: {e.stderr or str(e)}"
+        except Exception as e:
+            for docx_path in self.docx_paths:
+                self.error.emit(docx_path, str(e))
+            return
 
-            pdf_path = Path(self.output_dir) / (Path(self.docx_path).stem + ".pdf")
+        # Report each file; a failed batch may still have converted some of them
+        for docx_path in self.docx_paths:
+            pdf_path = Path(self.output_dir) / (Path(docx_path).stem + ".pdf")
             if pdf_path.exists():
-                self.progress.emit(self.docx_path, 100)
-                self.finished.emit(self.docx_path, str(pdf_path))
+                self.progress.emit(docx_path, 100)
+                self.finished.emit(docx_path, str(pdf_path))
             else:
-                self.error.emit(self.docx_path, "Conversion failed: PDF not created.")
-        except subprocess.CalledProcessError as e:
-            error_msg = f"LibreOffice conversion failed: {e.stderr or str(e)}"
-            self.error.emit(self.docx_path, error_msg)
+                self.error.emit(docx_path, missing_msg)
+
+
+# ------------------ UPLOAD COPIER ------------------
+class UploadCopyThread(QThread):
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, copies: list):
+        super().__init__()
+        self.copies = copies  # [(source path, destination Path)]
+
+    def _copy_one(self, copy):
+        src, dest = copy
+        # Copy under a hidden name so load_files never picks up a half-written file
+        part = dest.with_name(f".{dest.name}.part")
+        try:
+            shutil.copyfile(src, part)
+            os.replace(part, dest)
         except Exception as e:
-            self.error.emit(self.docx_path, str(e))
+            part.unlink(missing_ok=True)
+            self.error.emit(f"Failed to copy {Path(src).name}: {e}")
+
+    def run(self):
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=UPLOAD_COPY_WORKERS
+        ) as executor:
+            list(executor.map(self._copy_one, self.copies))
+        self.finished.emit()
 
 
 # ------------------ VCAA SCRAPER ------------------
+# Flat <a href="...">text</a> links, matched on the raw bytes without building a tree
+_RE_ANCHOR = re.compile(
+    rb'<a(?=\s)[^>]*?\shref\s*=\s*(?:"([^"]*)"|\'([^\']*)\')[^>]*>([^<]{0,200})</a>', re.I
+)
+# Every <a> whose href points at a document, nested markup or not
+_RE_DOC_ANCHOR = re.compile(
+    rb'<a(?=\s)[^>]*?\shref\s*=\s*'
+    rb'(?:"[^"]*\.(?:pdf|docx?)\s*"|\'[^\']*\.(?:pdf|docx?)\s*\'|[^"\'\s>]+\.(?:pdf|docx?)[\s>])',
+    re.I,
+)
+
+
 class VCAASubjectScraperThread(QThread):
     finished = pyqtSignal(dict)  # {subject_name: url}
     error = pyqtSignal(str)
 
     def run(self):
         try:
-            headers = {"User-Agent": "Mozilla/5.0"}
-            resp = requests.get(
-                VCAA_SUBJECTS_PAGE, headers=headers, timeout=30, verify=False
+            resp = PAGE_SESSION.get(
+                VCAA_SUBJECTS_PAGE, timeout=30, verify=False
             )
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            doc = lxml_html.fromstring(resp.content)
             subjects = {}
-            for link in soup.find_all("a", href=True):
-                text = link.get_text(strip=True)
-                href = link["href"].strip()
+            for link in doc.xpath("//a[@href]"):
+                text = " ".join((link.text_content() or "").split())
+                href = link.get("href").strip()
                 if not href:
                     continue
                 full = urljoin(VCAA_BASE, href)
@@ -303,28 +520,53 @@ class VCAADownloadThread(QThread):
         if REPORT_TOKEN not in t:
             return True
         # Keep only PDF/DOC/DOCX
-        if not (h.endswith(".pdf") or h.endswith(".docx") or h.endswith(".doc")):
+        if not h.endswith(DOC_LINK_EXTS):
             return True
         return False
 
+    @staticmethod
+    def _anchors_fast(content: bytes):
+        for m in _RE_ANCHOR.finditer(content):
+            yield (
+                html.unescape((m.group(1) or m.group(2)).decode("utf-8", "replace")),
+                html.unescape(m.group(3).decode("utf-8", "replace")),
+            )
+
+    @staticmethod
+    def _anchors_lxml(content: bytes):
+        doc = lxml_html.fromstring(content)
+        for a in doc.xpath("//a[@href]"):
+            yield a.get("href"), a.text_content() or ""
+
+    def _collect_links(self, anchors):
+        links = []
+        for href, text in anchors:
+            href = href.strip()
+            text = " ".join(text.split())
+            if not href:
+                continue
+            if self._should_skip(href, text):
+                continue
+            links.append(urljoin(VCAA_BASE, href))
+        return links
+
     def run(self):
         try:
-            headers = {"User-Agent": "Mozilla/5.0"}
-            resp = requests.get(
-                self.subject_url, headers=headers, timeout=30, verify=False
+            resp = PAGE_SESSION.get(
+                self.subject_url, timeout=30, verify=False
             )
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            links = []
-            for a in soup.find_all("a", href=True):
-                href = a["href"].strip()
-                text = a.get_text(strip=True)
-                if not href:
-                    continue
-                if self._should_skip(href, text):
-                    continue
-                links.append(urljoin(VCAA_BASE, href))
+            # VCAA's report links are plain anchors, so a regex over the bytes finds
+            # them; fall back to a full parse whenever the page has document links
+            # the regex couldn't read (e.g. <a><span>...</span></a>)
+            anchors = list(self._anchors_fast(resp.content))
+            doc_anchors = sum(
+                1 for href, _ in anchors
+                if href.strip().lower().endswith(DOC_LINK_EXTS)
+            )
+            if len(_RE_DOC_ANCHOR.findall(resp.content)) > doc_anchors:
+                anchors = self._anchors_lxml(resp.content)
+            links = self._collect_links(anchors)
 
             total = len(links)
             if total == 0:
@@ -342,37 +584,43 @@ class VCAADownloadThread(QThread):
             def download_one(file_url):
                 nonlocal completed
                 filename = file_url.split("/")[-1]
+                source_name = Path(filename)
+                # Hidden partial name: the folder watcher's rescan skips dotfiles,
+                # so a half-written report is never listed or queued for conversion
+                part_path = subject_folder / f".{filename}.part"
                 try:
-                    r = requests.get(
-                        file_url, headers=headers, timeout=120, verify=False
-                    )
-                    r.raise_for_status()
-
-                    # Use original name temporarily to parse year/exam number
-                    temp_path = subject_folder / filename
-                    with open(temp_path, "wb") as f:
-                        f.write(r.content)
-
-                    # Infer year/exam from filename; fix subject to dialog selection
-                    _, year, exam_number = parse_filename(temp_path)
+                    # Stream straight to disk instead of buffering the whole file
+                    with SESSION.get(
+                        file_url, stream=True, timeout=120, verify=False
+                    ) as r:
+                        r.raise_for_status()
+                        r.raw.decode_content = True
+                        with open(part_path, "wb") as f:
+                            shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+
+                    # Infer year/exam from the original filename; fix subject to dialog selection
+                    _, year, exam_number = parse_filename(source_name)
 
                     # Build final filename
-                    ext = temp_path.suffix.lower()
+                    ext = source_name.suffix.lower()
                     parts = [self._clean_filename(self.subject_name)]
                     if year and year != "Unknown":
                         parts.append(year)
                     if exam_number and exam_number != "Unknown":
                         parts.append(exam_number)
-                    final_stem = "_".join(parts) if parts else temp_path.stem
+                    final_stem = "_".join(parts) if parts else source_name.stem
                     final_path = subject_folder / f"{final_stem}{ext}"
 
-                    # Avoid overwrites
+                    # Avoid overwrites; the move refuses an existing name, so two
+                    # workers can't claim the same one
                     counter = 2
-                    while final_path.exists():
-                        final_path = subject_folder / f"{final_stem}_{counter}{ext}"
-                        counter += 1
-
-                    temp_path.rename(final_path)
+                    while True:
+                        try:
+                            _move_file(part_path, final_path)
+                            break
+                        except FileExistsError:
+                            final_path = subject_folder / f"{final_stem}_{counter}{ext}"
+                            counter += 1
                     self.file_done.emit(str(final_path))
 
                     with lock:
@@ -381,11 +629,22 @@ class VCAADownloadThread(QThread):
                             f"Finished downloading {filename}", completed, total
                         )
                 except Exception as e:
+                    try:
+                        part_path.unlink(missing_ok=True)
+                    except OSError:
+                        pass
                     self.error.emit(f"Failed to download {filename}: {str(e)}")
 
             self.progress.emit("Starting concurrent downloads...", 0, total)
 
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            # Open a connection to the host up front so DNS and the TLS
+            # handshake are done before the workers start pulling files
+            try:
+                SESSION.head(VCAA_BASE, allow_redirects=False, timeout=10, verify=False)
+            except requests.RequestException:
+                pass
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
                 futures = [executor.submit(download_one, url) for url in links]
                 concurrent.futures.wait(futures)
 
@@ -465,10 +724,14 @@ class VCEViewer(QMainWindow):
         self.threads = []
 
         # Track conversion queue/active
-        self._conversion_queue = []  # list[str path]
-        self._conversion_active = False
+        self._conversion_queue = deque()  # str paths; ids no longer in _queued_set are skipped
+        self._free_workers = list(range(MAX_CONVERSION_WORKERS))  # idle worker ids
         self._queued_set = set()  # to avoid duplicate enqueues
-        self._progress_by_path = {}  # str(path) -> int progress (0..100)
+        self._converting = set()  # ids handed to a worker and not yet reported back
+        self._progress_by_id = {}  # entry id -> int progress (0..100)
+        self._parse_cache = {}  # str(path) -> parse_filename() result
+        self._files_by_id = {}  # entry["id"] -> entry in self.files
+        self._items_by_id = {}  # entry["id"] -> visible QListWidgetItem
 
         # Buttons
         self.upload_btn = QPushButton("Upload Reports")
@@ -499,8 +762,13 @@ class VCEViewer(QMainWindow):
         # File list
         self.file_list = QListWidget()
         self.file_list.itemClicked.connect(self.open_file)
+        # Ctrl/Shift-click selects several reports for a single bulk delete
+        self.file_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
         self.file_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.file_list.customContextMenuRequested.connect(self.show_context_menu)
+        # Shared by every subject header row; QFont needs the QApplication, so not module-level
+        self._header_font = QFont()
+        self._header_font.setBold(True)
         left_layout.addWidget(self.file_list)
         left_widget = QWidget()
         left_widget.setLayout(left_layout)
@@ -553,7 +821,20 @@ class VCEViewer(QMainWindow):
         self.files = []  # list of dict entries
         self.current_pdf_path = None
 
-        self.load_files()
+        # Rescans requested in quick succession (downloads, renames, deletes)
+        # are coalesced into one after a short delay
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(100)
+        self._reload_timer.timeout.connect(self._do_load_files)
+
+        # Pick up reports added or removed outside the app as well; the upload
+        # folder and each subject folder are watched (not converted/)
+        self._fs_watch = QFileSystemWatcher(self)
+        self._fs_watch.directoryChanged.connect(self.load_files)
+        self._watched_dirs = set()
+
+        self._do_load_files()
 
     def zoom_in(self):
         """Increase the zoom factor by 10%."""
@@ -565,38 +846,95 @@ class VCEViewer(QMainWindow):
         self.current_zoom = max(self.current_zoom / 1.1, 0.25)  # Min zoom 25%
         self.pdf_view.setZoomFactor(self.current_zoom)
 
+    def _track_thread(self, thread):
+        # Keep a reference so live threads aren't garbage collected, dropping the
+        # ones that have already ended. The worker classes shadow QThread.finished
+        # with their own signals, so pruning on add is simpler than a callback
+        self.threads = [t for t in self.threads if not t.isFinished()]
+        self.threads.append(thread)
+
     # ---------- FILES ----------
+    def _sync_watched_dirs(self, wanted):
+        # Compare against our own set; the watcher may report paths normalised
+        added = wanted - self._watched_dirs
+        removed = self._watched_dirs - wanted
+        if added:
+            self._fs_watch.addPaths(sorted(added))
+        if removed:
+            self._fs_watch.removePaths(sorted(removed))
+        self._watched_dirs = wanted
+
     def load_files(self):
+        # Schedule a rescan; calls made while one is pending fold into it, so a
+        # burst still refreshes at most every 100 ms rather than only at the end
+        if not self._reload_timer.isActive():
+            self._reload_timer.start()
+
+    def _do_load_files(self):
         self.files.clear()
         subjects = set()
         years = set()
-
-        # Walk subject folders, skipping CONVERTED_DIR
-        for subject_folder in sorted(
-                p for p in UPLOAD_DIR.iterdir() if p.is_dir() and p != CONVERTED_DIR
-        ):
-            for file in sorted(subject_folder.glob("*")):
-                if file.suffix.lower() not in SUPPORTED_EXTENSIONS:
-                    continue
-                subject, year, exam_number = parse_filename(file)
+        # parse_filename only looks at the name, so reuse results across reloads
+        parse_cache = {}
+        # One directory read instead of an exists() check per Word file. The
+        # folder may have been deleted from Finder/Explorer, so recreate it
+        CONVERTED_DIR.mkdir(parents=True, exist_ok=True)
+        converted = set(os.listdir(CONVERTED_DIR))
+
+        # Walk subject folders, skipping CONVERTED_DIR. scandir() hands back
+        # names and file types from the directory read itself, so only the
+        # supported reports ever become Path objects
+        converted_dir = str(CONVERTED_DIR)
+        try:
+            with os.scandir(UPLOAD_DIR) as it:
+                subject_folders = sorted(
+                    (d for d in it if d.is_dir() and d.path != converted_dir),
+                    key=lambda d: d.name,
+                )
+        except FileNotFoundError:
+            subject_folders = []
+        self._sync_watched_dirs(
+            {str(UPLOAD_DIR)} | {d.path for d in subject_folders}
+        )
+        for subject_folder in subject_folders:
+            try:
+                with os.scandir(subject_folder.path) as it:
+                    report_files = sorted(
+                        Path(f.path)
+                        for f in it
+                        # glob("*") used to skip dotfiles such as macOS "._" sidecars
+                        if not f.name.startswith(".")
+                        and os.path.splitext(f.name)[1].lower() in SUPPORTED_EXTENSIONS
+                        and f.is_file()
+                    )
+            except FileNotFoundError:
+                # Removed since the upload folder was listed; the watcher rescans
+                continue
+            for file in report_files:
+                file_id = str(file)
+                parsed = self._parse_cache.get(file_id)
+                if parsed is None:
+                    parsed = parse_filename(file)
+                parse_cache[file_id] = parsed
+                subject, year, exam_number = parsed
                 folder_subject = subject_folder.name or subject
                 subject = folder_subject
 
                 # Compute pdf path: for .pdf, itself; for Word, converted path in CONVERTED_DIR
                 if file.suffix.lower() in WORD_EXTENSIONS:
-                    conv_pdf = CONVERTED_DIR / (file.stem + ".pdf")
-                    pdf_path = conv_pdf if conv_pdf.exists() else None
+                    conv_name = file.stem + ".pdf"
+                    pdf_path = CONVERTED_DIR / conv_name if conv_name in converted else None
                     # progress: keep last known, else 0
-                    prog = self._progress_by_path.get(str(file), 0)
+                    prog = self._progress_by_id.get(file_id, 0)
                     # if not converted and not already queued, enqueue
-                    if pdf_path is None and str(file) not in self._queued_set:
-                        self.enqueue_conversion(str(file))
+                    if pdf_path is None and file_id not in self._queued_set:
+                        self.enqueue_conversion(file_id)
                 else:
                     pdf_path = file
                     prog = 0  # PDFs don't show a bar
 
                 entry = {
-                    "id": str(file),  # stable id by path
+                    "id": file_id,  # stable id by path
                     "path": file,
                     "subject": subject,
                     "year": year,
@@ -619,6 +957,8 @@ class VCEViewer(QMainWindow):
             )
 
         self.files.sort(key=get_sort_key)
+        self._parse_cache = parse_cache
+        self._files_by_id = {e["id"]: e for e in self.files}
 
         self.update_filters(subjects, years)
         self.populate_file_list()
@@ -639,12 +979,18 @@ class VCEViewer(QMainWindow):
         self.subject_filter.blockSignals(False)
         self.year_filter.blockSignals(False)
 
-    def _matches_filters(self, entry):
+    def _filtered_entries(self):
+        # Read the combos once per rebuild rather than twice per entry
         subj = self.subject_filter.currentText()
         year = self.year_filter.currentText()
-        return (subj == "All Subjects" or entry["subject"] == subj) and (
-                year == "All Years" or entry["year"] == year
-        )
+        if subj == "All Subjects" and year == "All Years":
+            return list(self.files)
+        return [
+            e
+            for e in self.files
+            if (subj == "All Subjects" or e["subject"] == subj)
+               and (year == "All Years" or e["year"] == year)
+        ]
 
     def populate_file_list(self):
         # Save current scroll position
@@ -652,15 +998,16 @@ class VCEViewer(QMainWindow):
         scroll_position = scroll_bar.value() if scroll_bar else 0
 
         # Rebuild visible list based on filters
+        # Hold repaints and item signals until the whole list is rebuilt
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
         self.file_list.clear()
-        filtered = [e for e in self.files if self._matches_filters(e)]
-
-        # Sort filtered entries (though self.files is already sorted, but in case)
-        def get_group_key(e):
-            y = int(e["year"]) if e["year"].isdigit() else 0
-            return e["subject"].lower(), -y, e["exam_number"]
-
-        filtered.sort(key=get_group_key)
+        self._items_by_id = {}
+        for e in self.files:
+            e["_bar"] = None
+        # self.files is sorted in _do_load_files with the same key the grouping below
+        # relies on, so the filtered subset is already in order
+        filtered = self._filtered_entries()
 
         subj_filter = self.subject_filter.currentText()
         year_filter = self.year_filter.currentText()
@@ -677,9 +1024,7 @@ class VCEViewer(QMainWindow):
             if add_subject_headers and subj != current_subject:
                 header_item = QListWidgetItem(f"--- {subj} ---")
                 header_item.setFlags(Qt.ItemFlag.NoItemFlags)
-                font = header_item.font()
-                font.setBold(True)
-                header_item.setFont(font)
+                header_item.setFont(self._header_font)
                 self.file_list.addItem(header_item)
                 current_subject = subj
 
@@ -687,59 +1032,74 @@ class VCEViewer(QMainWindow):
                 f"{entry['subject']}_{entry['year']}_{entry['exam_number']}.pdf"
             )
 
-            row_widget = QWidget()
-            vbox = QVBoxLayout(row_widget)
-            vbox.setContentsMargins(6, 6, 6, 6)
-
-            lbl = QLabel(label_text)
-            lbl.setStyleSheet("font-weight: 500;")
-            vbox.addWidget(lbl)
-
-            # Show a progress bar ONLY for Word files not yet converted
-            show_bar = (entry["path"].suffix.lower() in WORD_EXTENSIONS) and (
-                    entry["pdf_path"] is None
-            )
-            if show_bar:
-                bar = QProgressBar()
-                bar.setRange(0, 100)
-                bar.setValue(int(entry.get("progress", 0)))
-                vbox.addWidget(bar)
+            row_widget = self._build_row_widget(label_text, entry)
 
             item = QListWidgetItem()
             item.setData(Qt.ItemDataRole.UserRole, entry["id"])
             self.file_list.addItem(item)
+            self._items_by_id[entry["id"]] = item
             self.file_list.setItemWidget(item, row_widget)
             item.setSizeHint(row_widget.sizeHint())
 
+        self.file_list.blockSignals(False)
+        self.file_list.setUpdatesEnabled(True)
+
         # Restore scroll position
         if scroll_bar:
             scroll_bar.setValue(scroll_position)
 
+    def _build_row_widget(self, label_text, entry):
+        row_widget = QWidget()
+        vbox = QVBoxLayout(row_widget)
+        vbox.setContentsMargins(6, 6, 6, 6)
+
+        lbl = QLabel(label_text)
+        lbl.setStyleSheet("font-weight: 500;")
+        vbox.addWidget(lbl)
+
+        # Show a progress bar ONLY for Word files not yet converted
+        show_bar = (entry["path"].suffix.lower() in WORD_EXTENSIONS) and (
+                entry["pdf_path"] is None
+        )
+        bar = None
+        if show_bar:
+            bar = QProgressBar()
+            bar.setRange(0, 100)
+            bar.setValue(int(entry.get("progress", 0)))
+            vbox.addWidget(bar)
+        entry["_bar"] = bar
+        return row_widget
+
     def _update_progress_ui(self, path_str: str, value: int):
         # Update stored progress and the visible bar if the row is currently displayed
-        self._progress_by_path[path_str] = value
-        # also update in files
-        for entry in self.files:
-            if entry["id"] == path_str:
-                entry["progress"] = value
-                break
-        # Update visible row if present
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == path_str:
-                widget = self.file_list.itemWidget(item)
-                if widget:
-                    bars = widget.findChildren(QProgressBar)
-                    if bars:
-                        bars[0].setValue(int(value))
-                break
+        self._progress_by_id[path_str] = value
+        entry = self._files_by_id.get(path_str)
+        if entry is None:
+            return
+        # Steps under 2% don't change the bar visibly; always let 100% through
+        if value != 100 and abs(value - entry.get("progress", 0)) < 2:
+            return
+        entry["progress"] = value
+        # The bar is held on the entry while its row is shown, so no list walk
+        bar = entry.get("_bar")
+        if bar is not None:
+            bar.setValue(int(value))
+
+    def _refresh_row(self, entry):
+        item = self._items_by_id.get(entry["id"])
+        if item is None:
+            return
+        label_text = f"{entry['subject']}_{entry['year']}_{entry['exam_number']}.pdf"
+        row_widget = self._build_row_widget(label_text, entry)
+        self.file_list.setItemWidget(item, row_widget)
+        item.setSizeHint(row_widget.sizeHint())
 
     def open_file(self, item):
         entry_id = item.data(Qt.ItemDataRole.UserRole)
-        entry = next((f for f in self.files if f["id"] == entry_id), None)
+        entry = self._files_by_id.get(entry_id)
         if not entry:
             return
-        if entry["pdf_path"] and Path(entry["pdf_path"]).exists():
+        if entry["pdf_path"] and entry["pdf_path"].exists():
             self.pdf_doc.load(str(entry["pdf_path"]))
             self.current_pdf_path = str(entry["pdf_path"])
         else:
@@ -755,6 +1115,8 @@ class VCEViewer(QMainWindow):
             str(Path.home()),
             "Reports (*.pdf *.doc *.docx)",
         )
+        copies = []
+        pending = set()
         for p in paths:
             original_name = Path(p).name
             subject, _, _ = parse_filename(Path(p))
@@ -762,9 +1124,21 @@ class VCEViewer(QMainWindow):
             subject_folder = UPLOAD_DIR / subj_folder_name
             subject_folder.mkdir(exist_ok=True)
             dest = subject_folder / original_name
-            if not dest.exists():
-                shutil.copy(p, dest)
-        self.load_files()
+            if not dest.exists() and dest not in pending:
+                pending.add(dest)
+                copies.append((p, dest))
+        if not copies:
+            self.load_files()
+            return
+        # Copy off the GUI thread and reload once when every file is in place
+        copy_thread = UploadCopyThread(copies)
+        copy_thread.finished.connect(self.load_files)
+        copy_thread.error.connect(self._on_upload_error)
+        self._track_thread(copy_thread)
+        copy_thread.start()
+
+    def _on_upload_error(self, msg):
+        QMessageBox.warning(self, "Upload Failed", msg)
 
     # ---------- CONVERSION QUEUE ----------
     def enqueue_conversion(self, doc_path_str: str):
@@ -776,24 +1150,37 @@ class VCEViewer(QMainWindow):
         self._queued_set.add(doc_path_str)
         self._conversion_queue.append(doc_path_str)
         # ensure an initial 0% progress bar is visible for this item
-        self._progress_by_path.setdefault(doc_path_str, 0)
+        self._progress_by_id.setdefault(doc_path_str, 0)
 
     def _start_next_conversion_if_idle(self):
-        if self._conversion_active:
-            return
-        if not self._conversion_queue:
-            return
-        self._conversion_active = True
-        doc_path = self._conversion_queue.pop(0)
-        # kick UI to 0 if not already set
-        self._update_progress_ui(doc_path, self._progress_by_path.get(doc_path, 0))
-        # Start converter
-        thread = DocxConverterThread(doc_path, str(CONVERTED_DIR))
-        thread.progress.connect(self._on_conv_progress)
-        thread.finished.connect(self._on_conv_finished)
-        thread.error.connect(self._on_conv_error)
-        self.threads.append(thread)
-        thread.start()
+        while self._free_workers and self._conversion_queue:
+            # Split the queue evenly across idle workers, up to a full batch each
+            batch_size = min(
+                CONVERSION_BATCH_SIZE,
+                -(-len(self._conversion_queue) // len(self._free_workers)),
+            )
+            batch = []
+            while self._conversion_queue and len(batch) < batch_size:
+                doc_path = self._conversion_queue.popleft()
+                # Cancelled (renamed/deleted) ids are dropped here instead of being
+                # searched for in the queue; skip re-queued copies already running
+                if doc_path in self._queued_set and doc_path not in self._converting:
+                    self._converting.add(doc_path)
+                    batch.append(doc_path)
+            if not batch:
+                break
+            worker_id = self._free_workers.pop()
+            # kick UI to 0 if not already set
+            for doc_path in batch:
+                self._update_progress_ui(doc_path, self._progress_by_id.get(doc_path, 0))
+            # Start converter
+            thread = DocxConverterThread(batch, str(CONVERTED_DIR), worker_id)
+            thread.progress.connect(self._on_conv_progress)
+            thread.finished.connect(self._on_conv_finished)
+            thread.error.connect(self._on_conv_error)
+            thread.batch_done.connect(self._on_conv_batch_done)
+            self._track_thread(thread)
+            thread.start()
 
     def _on_conv_progress(self, doc_path, value):
         self._update_progress_ui(doc_path, value)
@@ -802,19 +1189,19 @@ class VCEViewer(QMainWindow):
         # Update entries: set pdf_path, progress 100, remove from queued set
         self._update_progress_ui(doc_path, 100)
         self._queued_set.discard(doc_path)
+        self._converting.discard(doc_path)
         # Reflect converted PDF in file model
-        for f in self.files:
-            if f["id"] == doc_path:
-                f["pdf_path"] = Path(pdf_path)
-                break
-        # Reload files to update sorting
-        self.load_files()
-        # Allow next conversion
-        self._conversion_active = False
-        self._start_next_conversion_if_idle()
+        entry = self._files_by_id.get(doc_path)
+        if entry is None:
+            return
+        entry["pdf_path"] = Path(pdf_path)
+        # Swap just this row's widget for one without the progress bar;
+        # the sort order doesn't depend on pdf_path so nothing else moves
+        self._refresh_row(entry)
 
     def _on_conv_error(self, doc_path, msg):
         self._queued_set.discard(doc_path)
+        self._converting.discard(doc_path)
         QMessageBox.warning(
             self,
             "Conversion Failed",
@@ -823,7 +1210,9 @@ class VCEViewer(QMainWindow):
         )
         # Reset progress to 0
         self._update_progress_ui(doc_path, 0)
-        self._conversion_active = False
+
+    def _on_conv_batch_done(self, worker_id):
+        self._free_workers.append(worker_id)
         self._start_next_conversion_if_idle()
 
     # ---------- CONTEXT ----------
@@ -833,16 +1222,22 @@ class VCEViewer(QMainWindow):
             return
         menu = QMenu()
         edit_action = menu.addAction("Edit Properties")
-        delete_action = menu.addAction("Delete Report")
+        selected = self.file_list.selectedItems()
+        if item.isSelected() and len(selected) > 1:
+            delete_action = menu.addAction(f"Delete {len(selected)} Reports")
+            to_delete = selected
+        else:
+            delete_action = menu.addAction("Delete Report")
+            to_delete = [item]
         action = menu.exec(self.file_list.mapToGlobal(point))
         if action == edit_action:
             self.edit_properties(item)
         elif action == delete_action:
-            self.delete_report(item)
+            self.delete_reports(to_delete)
 
     def edit_properties(self, item):
         entry_id = item.data(Qt.ItemDataRole.UserRole)
-        entry = next((f for f in self.files if f["id"] == entry_id), None)
+        entry = self._files_by_id.get(entry_id)
         if not entry:
             return
         dialog = EditPropertiesDialog(
@@ -853,7 +1248,22 @@ class VCEViewer(QMainWindow):
             new_folder = UPLOAD_DIR / (new_subject if new_subject else "Misc")
             new_folder.mkdir(exist_ok=True)
             ext = entry["path"].suffix
-            new_path = new_folder / f"{new_subject}_{new_year}_{new_exam}{ext}"
+            is_word = ext.lower() in WORD_EXTENSIONS
+            old_stem = entry["path"].stem
+            new_stem = f"{new_subject}_{new_year}_{new_exam}"
+            new_path = new_folder / f"{new_stem}{ext}"
+            old_converted = CONVERTED_DIR / (old_stem + ".pdf")
+            new_converted = CONVERTED_DIR / (new_stem + ".pdf")
+            # Never overwrite another report (or its converted PDF) with the renamed one
+            if _is_other_file(new_path, entry["path"]) or (
+                    is_word and _is_other_file(new_converted, old_converted)
+            ):
+                QMessageBox.warning(
+                    self,
+                    "Rename Failed",
+                    f"A report named {new_path.name} already exists.",
+                )
+                return
             try:
                 # If currently open, close before rename
                 if entry["pdf_path"] and self.current_pdf_path == str(
@@ -865,45 +1275,39 @@ class VCEViewer(QMainWindow):
                 # Update queue bookkeeping if needed
                 was_queued = entry["id"] in self._queued_set
                 if was_queued:
-                    # remove old path from queue list if present
-                    try:
-                        self._conversion_queue.remove(entry["id"])
-                    except ValueError:
-                        pass
+                    # its queue slot is skipped once it's no longer in _queued_set
                     self._queued_set.discard(entry["id"])
 
                 # Rename source file
-                old_path = entry["path"]
-                entry["path"].rename(new_path)
+                old_id = entry["id"]
+                _move_file(entry["path"], new_path)
 
                 # If Word with converted PDF, rename converted too
-                if ext.lower() in WORD_EXTENSIONS:
-                    old_converted = CONVERTED_DIR / (old_path.stem + ".pdf")
-                    new_converted = CONVERTED_DIR / (new_path.stem + ".pdf")
-                    if old_converted.exists():
-                        old_converted.rename(new_converted)
+                if is_word:
+                    try:
+                        _move_file(old_converted, new_converted)
                         entry["pdf_path"] = new_converted
-                    else:
+                    except FileNotFoundError:  # not converted yet
                         entry["pdf_path"] = None
                 else:
                     entry["pdf_path"] = new_path  # it is the PDF
 
-                # Update entry fields
+                # Update entry fields, re-keying the id index
+                self._files_by_id.pop(entry["id"], None)
                 entry["id"] = str(new_path)
+                self._files_by_id[entry["id"]] = entry
                 entry["subject"] = new_subject
                 entry["year"] = new_year
                 entry["exam_number"] = new_exam
                 entry["path"] = new_path
 
                 # carry progress state to new key
-                prog = self._progress_by_path.pop(
-                    str(old_path), entry.get("progress", 0)
-                )
-                self._progress_by_path[str(new_path)] = prog
+                prog = self._progress_by_id.pop(old_id, entry.get("progress", 0))
+                self._progress_by_id[entry["id"]] = prog
 
                 # re-enqueue under new path if needed
                 if was_queued:
-                    self.enqueue_conversion(str(new_path))
+                    self.enqueue_conversion(entry["id"])
 
                 # Reload files to update sorting
                 self.load_files()
@@ -912,40 +1316,50 @@ class VCEViewer(QMainWindow):
                 QMessageBox.warning(self, "Rename Failed", str(e))
 
     def delete_report(self, item):
-        entry_id = item.data(Qt.ItemDataRole.UserRole)
-        entry = next((f for f in self.files if f["id"] == entry_id), None)
-        if not entry:
+        self.delete_reports([item])
+
+    def delete_reports(self, items):
+        # One confirmation and one rescan for the whole selection
+        entries = []
+        for item in items:
+            entry = self._files_by_id.get(item.data(Qt.ItemDataRole.UserRole))
+            if entry:
+                entries.append(entry)
+        if not entries:
             return
-        if entry["pdf_path"] and self.current_pdf_path == str(entry["pdf_path"]):
-            self.pdf_doc.close()
-            self.current_pdf_path = None
+        for entry in entries:
+            if entry["pdf_path"] and self.current_pdf_path == str(entry["pdf_path"]):
+                self.pdf_doc.close()
+                self.current_pdf_path = None
+        if len(entries) == 1:
+            question = f"Delete {entries[0]['path'].name}?"
+        else:
+            question = f"Delete {len(entries)} reports?"
         reply = QMessageBox.question(
             self,
             "Delete Report",
-            f"Delete {entry['path'].name}?",
+            question,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                # If queued, remove from queue
-                if entry["id"] in self._queued_set:
-                    try:
-                        self._conversion_queue.remove(entry["id"])
-                    except ValueError:
-                        pass
-                    self._queued_set.discard(entry["id"])
-                # Delete source file
-                if entry["path"].exists():
-                    entry["path"].unlink()
-                # Delete converted PDF if it exists and is distinct
-                if (
-                        entry["pdf_path"]
-                        and Path(entry["pdf_path"]).exists()
-                        and Path(entry["pdf_path"]) != entry["path"]
-                ):
-                    Path(entry["pdf_path"]).unlink()
-            except Exception as e:
-                QMessageBox.warning(self, "Delete Failed", str(e))
+            failures = []
+            for entry in entries:
+                try:
+                    # If queued, remove from queue
+                    if entry["id"] in self._queued_set:
+                        self._queued_set.discard(entry["id"])
+                    # Delete source file (missing_ok saves a separate exists() stat)
+                    entry["path"].unlink(missing_ok=True)
+                    # Delete converted PDF if it exists and is distinct
+                    pdf_path = entry["pdf_path"]  # always a Path or None
+                    if pdf_path and pdf_path != entry["path"]:
+                        pdf_path.unlink(missing_ok=True)
+                except Exception as e:
+                    failures.append(f"{entry['path'].name}: {e}")
+                else:
+                    self._files_by_id.pop(entry["id"], None)
+            if failures:
+                QMessageBox.warning(self, "Delete Failed", "\n".join(failures))
             self.load_files()
 
     # ---------- VCAA DOWNLOAD ----------
@@ -970,17 +1384,36 @@ class VCEViewer(QMainWindow):
         log_box = QTextEdit()
         log_box.setReadOnly(True)
         log_box.setMinimumHeight(160)
+        log_box.setUndoRedoEnabled(False)
         layout.addWidget(log_box)
 
+        # Progress lines arrive once per file; append them to the log in batches
+        log_buffer = []
+
+        def flush_log():
+            if log_buffer:
+                log_box.append("\n".join(log_buffer))
+                log_buffer.clear()
+
+        flush_timer = QTimer(dialog)
+        flush_timer.setInterval(50)
+        flush_timer.timeout.connect(flush_log)
+        flush_timer.start()
+        dialog.finished.connect(flush_timer.stop)
+
         download_btn = QPushButton("Download Reports")
         layout.addWidget(download_btn)
         dialog.setLayout(layout)
 
         # Load subjects asynchronously
         def on_subjects_loaded(subjects: dict):
-            combo.clear()
-            for s in sorted(subjects.keys()):
-                combo.addItem(s, subjects[s])
+            # Fill a detached model, then hand it to the combo in one go
+            model = QStandardItemModel(combo)
+            for s in sorted(subjects):
+                item = QStandardItem(s)
+                item.setData(subjects[s], Qt.ItemDataRole.UserRole)
+                model.appendRow(item)
+            combo.setModel(model)
             progress_label.setText(f"Loaded {len(subjects)} subjects from VCAA")
 
         def on_subject_error(msg):
@@ -990,7 +1423,7 @@ class VCEViewer(QMainWindow):
         scraper_thread.finished.connect(on_subjects_loaded)
         scraper_thread.error.connect(on_subject_error)
         scraper_thread.start()
-        self.threads.append(scraper_thread)
+        self._track_thread(scraper_thread)
 
         def download_selected():
             subject_name = combo.currentText()
@@ -1004,24 +1437,24 @@ class VCEViewer(QMainWindow):
                 progress_bar.setMaximum(total)
                 progress_bar.setValue(current)
                 progress_label.setText(f"{current}/{total}")
-                log_box.append(msg)
+                log_buffer.append(msg)
 
             def on_finished(msg):
-                log_box.append(msg)
+                log_buffer.append(msg)
+                flush_log()
                 QMessageBox.information(dialog, "Done", msg)
                 # Reload once at the end to update sorting
                 self.load_files()
 
             download_thread.progress.connect(update_progress)
-            download_thread.file_done.connect(
-                lambda _: self.load_files()
-            )  # Update after each file
+            # Each saved file asks for a (coalesced) reload; PyQt drops the path arg
+            download_thread.file_done.connect(self.load_files)
             download_thread.finished.connect(on_finished)
             download_thread.error.connect(
                 lambda msg: QMessageBox.warning(dialog, "Download Error", msg)
             )
             download_thread.start()
-            self.threads.append(download_thread)
+            self._track_thread(download_thread)
 
         download_btn.clicked.connect(download_selected)
         dialog.exec()